@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Firestore Backup Integrity Manifest
+
+This module builds and compares integrity manifests for backups created by
+firestore_backup.py. A manifest holds:
+1. A content hash for every document's data
+2. A per-document hash that also covers the document's subcollections
+3. A Merkle root per collection, rolled up from its document hashes
+4. A single root over all collections
+
+Two manifests can be compared by walking only the collections and documents
+whose hashes differ, so identical subtrees are skipped entirely.
+
+Usage:
+    from backup_manifest import build_manifest, diff_manifests
+"""
+
+import json
+import hashlib
+from typing import Dict, Any, List, Tuple
+
+MANIFEST_ALGORITHM = 'sha256'
+MANIFEST_VERSION = '1.0'
+
+
+def _normalize(data: Any) -> Any:
+    """
+    Normalize converted Firestore data before hashing.
+
+    Timestamps are reduced to their ISO string so the float epoch value
+    cannot introduce rounding differences between backups.
+
+    Args:
+        data: Data in the format produced by FirestoreBackup._convert_firestore_data
+
+    Returns:
+        Normalized data
+    """
+    if isinstance(data, dict):
+        if '_firestore_timestamp' in data:
+            return {'_firestore_timestamp': data.get('_iso_string')}
+        return {key: _normalize(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_normalize(item) for item in data]
+    else:
+        return data
+
+
+def _hash(data: Any) -> str:
+    """Hash data using its canonical JSON encoding."""
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def hash_document(doc_data: Any) -> str:
+    """
+    Hash the contents of a single document.
+
+    Args:
+        doc_data: Document data as stored in the backup file
+
+    Returns:
+        Hex digest of the document data
+    """
+    return _hash(_normalize(doc_data))
+
+
+def _drop_empty(collections: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Drop collection manifests with no documents and no read error.
+
+    Firestore does not list collections without documents, so an empty
+    collection in a backup is treated the same as an absent one.
+    """
+    return {
+        name: col for name, col in collections.items()
+        if col['documents'] or '_error' in col
+    }
+
+
+def build_document_manifest(doc_data: Any, subcollections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the manifest entry for a single document.
+
+    Args:
+        doc_data: Document data as stored in the backup file
+        subcollections: Mapping of subcollection name to collection manifest
+
+    Returns:
+        Dictionary with the document hash, data hash and subcollection manifests
+    """
+    data_hash = hash_document(doc_data)
+    subcollections = _drop_empty(subcollections)
+
+    doc_manifest = {
+        'hash': _hash({
+            'data': data_hash,
+            'subcollections': {name: sub['root'] for name, sub in subcollections.items()}
+        }),
+        'data_hash': data_hash
+    }
+    if subcollections:
+        doc_manifest['subcollections'] = subcollections
+
+    return doc_manifest
+
+
+def assemble_collection_manifest(documents: Dict[str, Dict[str, Any]],
+                                 error: str = None) -> Dict[str, Any]:
+    """
+    Roll document manifests up into a collection manifest.
+
+    Args:
+        documents: Mapping of document ID to document manifest
+        error: Read error recorded for the collection, if any
+
+    Returns:
+        Dictionary with the collection root and per-document hashes
+    """
+    doc_hashes = {doc_id: doc['hash'] for doc_id, doc in documents.items()}
+
+    if error is None:
+        return {
+            'root': _hash(doc_hashes),
+            'documents': documents
+        }
+
+    # Fold the error into the root so an incomplete read never matches a complete one
+    return {
+        'root': _hash({'_error': error, 'documents': doc_hashes}),
+        'documents': documents,
+        '_error': error
+    }
+
+
+def build_collection_manifest(collection_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the manifest for a collection recursively.
+
+    Args:
+        collection_data: Collection data as stored in the backup file
+
+    Returns:
+        Dictionary with the collection root and per-document hashes
+    """
+    documents = {}
+
+    for doc_id, doc_info in collection_data.items():
+        if doc_id == '_error':  # Read error marker written by _backup_collection
+            continue
+
+        subcollections = {
+            subcol_name: build_collection_manifest(subcol_data)
+            for subcol_name, subcol_data in doc_info.get('subcollections', {}).items()
+        }
+        documents[doc_id] = build_document_manifest(doc_info.get('data', {}), subcollections)
+
+    return assemble_collection_manifest(documents, collection_data.get('_error'))
+
+
+def build_manifest(collections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build an integrity manifest for a set of root collections.
+
+    Args:
+        collections: Mapping of collection name to collection data, as stored
+            under the 'collections' key of a backup file
+
+    Returns:
+        Manifest dictionary
+    """
+    return assemble_manifest({
+        name: build_collection_manifest(data) for name, data in collections.items()
+    })
+
+
+def assemble_manifest(collection_manifests: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Roll collection manifests up into a full integrity manifest.
+
+    Args:
+        collection_manifests: Mapping of root collection name to collection manifest
+
+    Returns:
+        Manifest dictionary
+    """
+    collection_manifests = _drop_empty(collection_manifests)
+
+    return {
+        'manifest_version': MANIFEST_VERSION,
+        'algorithm': MANIFEST_ALGORITHM,
+        'root': _hash({name: col['root'] for name, col in collection_manifests.items()}),
+        'collections': collection_manifests
+    }
+
+
+def find_incomplete(collections: Dict[str, Any], parent_path: str = "") -> List[Tuple[str, str]]:
+    """
+    Find collections whose read failed, recorded as '_error' in the manifest.
+
+    Args:
+        collections: Mapping of collection name to collection manifest
+        parent_path: Document path the collections belong to ('' for root)
+
+    Returns:
+        List of (path, error) tuples
+    """
+    incomplete = []
+
+    for name in sorted(collections):
+        path = f"{parent_path}/{name}" if parent_path else name
+        collection = collections[name]
+
+        if '_error' in collection:
+            incomplete.append((path, collection['_error']))
+
+        for doc_id in sorted(collection['documents']):
+            incomplete.extend(find_incomplete(
+                collection['documents'][doc_id].get('subcollections', {}),
+                f"{path}/{doc_id}"
+            ))
+
+    return incomplete
+
+
+def _diff_collections(source: Dict[str, Any], target: Dict[str, Any],
+                      parent_path: str = "") -> List[Tuple[str, str]]:
+    """
+    Compare two mappings of collection name to collection manifest.
+
+    Args:
+        source: Collection manifests of the reference side
+        target: Collection manifests of the side being checked
+        parent_path: Document path the collections belong to ('' for root)
+
+    Returns:
+        List of (status, path) tuples
+    """
+    differences = []
+
+    for name in sorted(set(source) | set(target)):
+        path = f"{parent_path}/{name}" if parent_path else name
+
+        if name not in target:
+            differences.append(('missing', path))
+        elif name not in source:
+            differences.append(('unexpected', path))
+        elif source[name]['root'] != target[name]['root']:
+            differences.extend(_diff_documents(source[name], target[name], path))
+
+    return differences
+
+
+def _diff_documents(source: Dict[str, Any], target: Dict[str, Any],
+                    collection_path: str) -> List[Tuple[str, str]]:
+    """
+    Compare the documents of two collection manifests whose roots differ.
+
+    Args:
+        source: Collection manifest of the reference side
+        target: Collection manifest of the side being checked
+        collection_path: Path of the collection
+
+    Returns:
+        List of (status, path) tuples
+    """
+    differences = []
+    source_docs = source['documents']
+    target_docs = target['documents']
+
+    for doc_id in sorted(set(source_docs) | set(target_docs)):
+        doc_path = f"{collection_path}/{doc_id}"
+
+        if doc_id not in target_docs:
+            differences.append(('missing', doc_path))
+        elif doc_id not in source_docs:
+            differences.append(('unexpected', doc_path))
+        elif source_docs[doc_id]['hash'] != target_docs[doc_id]['hash']:
+            if source_docs[doc_id]['data_hash'] != target_docs[doc_id]['data_hash']:
+                differences.append(('changed', doc_path))
+            differences.extend(_diff_collections(
+                source_docs[doc_id].get('subcollections', {}),
+                target_docs[doc_id].get('subcollections', {}),
+                doc_path
+            ))
+
+    return differences
+
+
+def diff_manifests(source: Dict[str, Any], target: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Compare two manifests, descending only into subtrees whose hashes differ.
+
+    Args:
+        source: Manifest of the reference side (e.g. the backup)
+        target: Manifest of the side being checked (e.g. live Firestore)
+
+    Returns:
+        List of (status, path) tuples where status is 'missing' (only in
+        source), 'unexpected' (only in target) or 'changed' (document data
+        differs). An empty list means both sides match. Check both manifests
+        with find_incomplete first, since read errors are not reported here.
+    """
+    if source['root'] == target['root']:
+        return []
+
+    return _diff_collections(source['collections'], target['collections'])
@@ -8,6 +8,7 @@ This script creates a complete backup of a Firestore database by:
 3. Saving the data in JSON format with timestamps
 4. Supporting both full backups and incremental backups
 5. Handling subcollections recursively
+6. Recording an integrity manifest of per-document hashes and per-collection Merkle roots
 
 Requirements:
 - firebase-admin package
@@ -29,6 +30,8 @@ import firebase_admin
 from firebase_admin import credentials, firestore
 from dotenv import load_dotenv
 
+from backup_manifest import build_manifest
+
 # Load environment variables
 load_dotenv()
 
@@ -182,7 +185,7 @@ class FirestoreBackup:
             backup_data['metadata'] = {
                 'backup_time': datetime.now().isoformat(),
                 'project_id': self.db.project,
-                'backup_version': '1.0',
+                'backup_version': '1.1',
                 'total_collections': 0,
                 'total_documents': 0
             }
@@ -210,6 +213,9 @@ class FirestoreBackup:
                 backup_data['metadata']['total_collections'] = collection_count
                 backup_data['metadata']['total_documents'] = total_docs
             
+            # Record integrity manifest for later verification
+            backup_data['manifest'] = build_manifest(backup_data['collections'])
+            
             # Save backup to file
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(backup_data, f, indent=2, ensure_ascii=False)
@@ -255,7 +261,8 @@ class FirestoreBackup:
             backup_data = {
                 'collection_name': collection_name,
                 'backup_time': datetime.now().isoformat(),
-                'data': collection_data
+                'data': collection_data,
+                'manifest': build_manifest({collection_name: collection_data})
             }
             
             with open(output_path, 'w', encoding='utf-8') as f:
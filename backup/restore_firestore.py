@@ -7,12 +7,14 @@ WARNING: This will overwrite existing data in your Firestore database.
 
 Usage:
     python restore_firestore.py backup_file.json
+
+Run verify_firestore.py afterwards to confirm the restore matches the backup.
 """
 
 import os
 import json
 import argparse
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 from pathlib import Path
 
@@ -74,8 +76,10 @@ class FirestoreRestore:
         """
         if isinstance(data, dict):
             if '_firestore_timestamp' in data:
-                # Convert timestamp back
-                return firestore.SERVER_TIMESTAMP  # Use server timestamp for simplicity
+                # Convert timestamp back to the original value
+                if data.get('_iso_string'):
+                    return datetime.fromisoformat(data['_iso_string'])
+                return datetime.fromtimestamp(data['_firestore_timestamp'], tz=timezone.utc)
             elif '_firestore_geopoint' in data:
                 # Convert GeoPoint back
                 return firestore.GeoPoint(data['latitude'], data['longitude'])
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Firestore Backup Verification Script
+
+This script verifies a backup created by firestore_backup.py by comparing
+integrity manifests (per-document hashes rolled up into per-collection Merkle
+roots). Only collections and documents whose hashes differ are inspected, so
+matching subtrees are skipped.
+
+Comparing against the live database still reads every document in the
+collections being verified, but each document is hashed as it is streamed
+and only the hashes are kept in memory.
+
+It can compare:
+1. A backup against the live Firestore database (e.g. after a restore)
+2. Two backup files against each other
+
+Usage:
+    python verify_firestore.py backup_file.json
+    python verify_firestore.py backup_file.json other_backup_file.json
+"""
+
+import json
+import argparse
+from typing import Dict, Any, List, Optional, Tuple
+
+from backup_manifest import (
+    MANIFEST_ALGORITHM, MANIFEST_VERSION, assemble_collection_manifest, assemble_manifest,
+    build_document_manifest, build_manifest, diff_manifests, find_incomplete
+)
+from firestore_backup import FirestoreBackup
+
+
+class FirestoreVerify:
+    def __init__(self, service_account_path: str = None, project_id: str = None):
+        """
+        Initialize Firestore verify utility.
+
+        Firebase is only connected when a backup is compared against the
+        live database.
+
+        Args:
+            service_account_path: Path to Firebase service account JSON file
+            project_id: Firebase project ID (optional if specified in service account)
+        """
+        self.service_account_path = service_account_path
+        self.project_id = project_id
+        self.backup = None
+
+    def _get_backup(self):
+        """Connect to Firestore through FirestoreBackup on first use."""
+        if self.backup is None:
+            self.backup = FirestoreBackup(
+                service_account_path=self.service_account_path,
+                project_id=self.project_id
+            )
+        return self.backup
+
+    def _load_backup(self, backup_file_path: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Load a backup file and check it against its stored manifest.
+
+        Args:
+            backup_file_path: Path to the backup JSON file
+
+        Returns:
+            Tuple of (manifest, collection name for a single-collection backup
+            or None for a full database backup)
+        """
+        try:
+            with open(backup_file_path, 'r', encoding='utf-8') as f:
+                backup_data = json.load(f)
+        except Exception as e:
+            raise Exception(f"Failed to load backup file: {str(e)}")
+
+        if 'collections' in backup_data:
+            collections = backup_data['collections']
+            collection_name = None
+        elif 'collection_name' in backup_data:
+            collection_name = backup_data['collection_name']
+            collections = {collection_name: backup_data.get('data', {})}
+        else:
+            raise Exception("Invalid backup file: missing 'collections' key")
+
+        manifest = build_manifest(collections)
+        self._check_complete(manifest, f"Backup {backup_file_path}")
+
+        stored_manifest = backup_data.get('manifest')
+        if stored_manifest is None:
+            print(f"⚠️  No manifest in {backup_file_path}, computing hashes from backup data")
+        elif (stored_manifest.get('manifest_version') != MANIFEST_VERSION
+              or stored_manifest.get('algorithm') != MANIFEST_ALGORITHM):
+            print(
+                f"⚠️  Manifest in {backup_file_path} uses version "
+                f"{stored_manifest.get('manifest_version')} / {stored_manifest.get('algorithm')} "
+                f"(expected {MANIFEST_VERSION} / {MANIFEST_ALGORITHM}), computing hashes from backup data"
+            )
+        else:
+            differences = diff_manifests(stored_manifest, manifest)
+            if differences:
+                raise Exception(
+                    f"Backup file does not match its own manifest "
+                    f"({len(differences)} differences): {backup_file_path}"
+                )
+            print(f"Backup file matches its manifest: {backup_file_path}")
+
+        return manifest, collection_name
+
+    def _check_complete(self, manifest: Dict[str, Any], label: str) -> None:
+        """Raise if any collection in the manifest was only partially read."""
+        incomplete = find_incomplete(manifest['collections'])
+        if incomplete:
+            path, error = incomplete[0]
+            raise Exception(
+                f"{label} read incomplete at {path}: {error}"
+                + (f" (and {len(incomplete) - 1} more)" if len(incomplete) > 1 else "")
+            )
+
+    def _filter_manifest(self, manifest: Dict[str, Any],
+                         collections_filter: list = None) -> Dict[str, Any]:
+        """Restrict a manifest to the requested collections (all if None)."""
+        if not collections_filter:
+            return manifest
+        return assemble_manifest({
+            name: col for name, col in manifest['collections'].items()
+            if name in collections_filter
+        })
+
+    def _hash_live_collection(self, collection_ref) -> Dict[str, Any]:
+        """
+        Build the manifest for a live collection recursively.
+
+        Documents are hashed as they are streamed, so only hashes are kept.
+
+        Args:
+            collection_ref: Firestore collection reference
+
+        Returns:
+            Collection manifest
+        """
+        backup = self._get_backup()
+        documents = {}
+        error = None
+
+        try:
+            for doc in collection_ref.stream():
+                subcollections = {
+                    subcol.id: self._hash_live_collection(subcol)
+                    for subcol in doc.reference.collections()
+                }
+                documents[doc.id] = build_document_manifest(
+                    backup._convert_firestore_data(doc.to_dict()), subcollections
+                )
+        except Exception as e:
+            error = str(e)
+
+        return assemble_collection_manifest(documents, error)
+
+    def _report(self, differences: List[Tuple[str, str]], source_label: str,
+                target_label: str) -> None:
+        """Print a summary of manifest differences."""
+        if not differences:
+            print(f"\n✅ {target_label} matches {source_label}")
+            return
+
+        print(f"\n❌ Found {len(differences)} differences between {source_label} and {target_label}:")
+        for status, path in differences:
+            print(f"  {status:<10} {path}")
+        print("\n  missing    = only in " + source_label)
+        print("  unexpected = only in " + target_label)
+        print("  changed    = document data differs")
+
+    def verify_against_live(self, backup_file_path: str,
+                            collections_filter: list = None) -> List[Tuple[str, str]]:
+        """
+        Compare a backup against the live Firestore database.
+
+        Args:
+            backup_file_path: Path to the backup JSON file
+            collections_filter: List of collection names to verify (verify all if None)
+
+        Returns:
+            List of (status, path) differences
+        """
+        print(f"Verifying backup against live Firestore: {backup_file_path}")
+
+        backup_manifest, collection_name = self._load_backup(backup_file_path)
+        backup_manifest = self._filter_manifest(backup_manifest, collections_filter)
+
+        backup = self._get_backup()
+        collection_names = set(backup_manifest['collections'])
+        if collections_filter:
+            collection_names |= set(collections_filter)
+        elif collection_name is None:
+            # Also pick up collections created since the backup was taken
+            collection_names |= {col.id for col in backup.db.collections()}
+        else:
+            # An empty single-collection backup has no manifest entry to read from
+            collection_names.add(collection_name)
+
+        live_collections = {}
+        for name in sorted(collection_names):
+            print(f"Hashing live collection: {name}")
+            live_collections[name] = self._hash_live_collection(backup.db.collection(name))
+
+        live_manifest = assemble_manifest(live_collections)
+        self._check_complete(live_manifest, "Live database")
+
+        differences = diff_manifests(backup_manifest, live_manifest)
+        self._report(differences, 'backup', 'live database')
+        return differences
+
+    def verify_backups(self, source_file_path: str, target_file_path: str,
+                       collections_filter: list = None) -> List[Tuple[str, str]]:
+        """
+        Compare two backup files against each other.
+
+        Args:
+            source_file_path: Path to the reference backup JSON file
+            target_file_path: Path to the backup JSON file being checked
+            collections_filter: List of collection names to verify (verify all if None)
+
+        Returns:
+            List of (status, path) differences
+        """
+        print(f"Comparing backups: {source_file_path} -> {target_file_path}")
+
+        source_manifest, _ = self._load_backup(source_file_path)
+        target_manifest, _ = self._load_backup(target_file_path)
+
+        differences = diff_manifests(
+            self._filter_manifest(source_manifest, collections_filter),
+            self._filter_manifest(target_manifest, collections_filter)
+        )
+        self._report(differences, 'first backup', 'second backup')
+        return differences
+
+
+def main():
+    """Main function to run the verify script."""
+    parser = argparse.ArgumentParser(description='Verify a Firestore backup against live data or another backup')
+    parser.add_argument('backup_file', type=str, help='Path to backup JSON file')
+    parser.add_argument('other_backup_file', type=str, nargs='?',
+                        help='Second backup JSON file to compare against (compares against live Firestore if omitted)')
+    parser.add_argument('--service-account', type=str, help='Path to Firebase service account JSON file')
+    parser.add_argument('--project-id', type=str, help='Firebase project ID')
+    parser.add_argument('--collections', nargs='+', help='Specific collections to verify')
+
+    args = parser.parse_args()
+
+    try:
+        verify = FirestoreVerify(
+            service_account_path=args.service_account,
+            project_id=args.project_id
+        )
+
+        if args.other_backup_file:
+            differences = verify.verify_backups(args.backup_file, args.other_backup_file, args.collections)
+        else:
+            differences = verify.verify_against_live(args.backup_file, args.collections)
+
+    except Exception as e:
+        print(f"❌ Verification failed: {str(e)}")
+        return 1
+
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    exit(main())